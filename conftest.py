@@ -0,0 +1,10 @@
+"""Shared pytest fixtures so the test scripts run in one session"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def gemini_model():
+    """Configured Gemini model, created once per pytest session"""
+    from llm_client import get_model
+    return get_model()
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""Shared, memoized .env loading for the test scripts"""
+
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def load() -> bool:
+    """Parse the .env file once per process, no matter how many modules ask"""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return True
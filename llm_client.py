@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Shared Gemini helpers for the test scripts"""
+
+import functools
+import os
+import env
+
+# Load environment variables (memoized across test modules)
+env.load()
+
+_model = None
+BATCH_SEPARATOR = "===RESPONSE BREAK==="
+
+
+def get_model():
+    """Return the shared GenerativeModel, configuring the SDK only once"""
+    global _model
+    if _model is None:
+        import google.generativeai as genai
+        genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+        _model = genai.GenerativeModel('gemini-2.0-flash')
+    return _model
+
+
+@functools.lru_cache(maxsize=16)
+def get_generation_config(max_tokens: int, temperature: float):
+    """Return a cached GenerationConfig for the given sampling settings"""
+    import google.generativeai as genai
+    return genai.types.GenerationConfig(
+        max_output_tokens=max_tokens,
+        temperature=temperature
+    )
+
+
+def batch_generate(prompts: list[str], max_tokens: int = 300, temperature: float = 0.7, model=None) -> list[str]:
+    """
+    Answer several prompts with a single Gemini request.
+
+    The prompts are numbered into one combined request and the model is
+    asked to separate its answers with a fixed marker line, so N prompts
+    cost one HTTP round-trip and one rate-limit slot instead of N.
+    Responses come back indexed by position. Falls back to one call per
+    prompt if the response cannot be split cleanly. Callers holding a
+    configured model (e.g. the pytest session fixture) can pass it in;
+    otherwise the shared singleton is used.
+    """
+    if model is None:
+        model = get_model()
+
+    if len(prompts) == 1:
+        response = model.generate_content(
+            prompts[0],
+            generation_config=get_generation_config(max_tokens, temperature)
+        )
+        return [response.text.strip()]
+
+    combined = (
+        f"Answer each numbered task separately. Separate the answers with a "
+        f"line containing exactly '{BATCH_SEPARATOR}'.\n\n"
+        + "\n\n".join(f"Task {i}:\n{prompt}" for i, prompt in enumerate(prompts, 1))
+    )
+    response = model.generate_content(
+        combined,
+        generation_config=get_generation_config(max_tokens * len(prompts), temperature)
+    )
+    answers = [part.strip() for part in response.text.split(BATCH_SEPARATOR)]
+    if len(answers) == len(prompts):
+        return answers
+
+    # Marker drift - retry one prompt at a time so callers still get
+    # positional results
+    return [batch_generate([prompt], max_tokens, temperature, model)[0] for prompt in prompts]
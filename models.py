@@ -1,7 +1,7 @@
 """
 Pydantic models for request and response validation
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 from datetime import date
 
@@ -9,17 +9,20 @@ from datetime import date
 class NewsSearchRequest(BaseModel):
     """Request model for news search endpoint"""
     commodity: str = Field(..., description="Commodity to search for (e.g., gold, oil, wheat)")
-    
-    class Config:
-        json_schema_extra = {
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "commodity": "gold"
             }
         }
+    )
 
 
 class NewsArticle(BaseModel):
     """Model for a single news article"""
+    model_config = ConfigDict(extra='ignore')
+
     title: str
     link: str
     snippet: str
@@ -37,9 +40,9 @@ class NewsSearchResponse(BaseModel):
 class ParaphraseRequest(BaseModel):
     """Request model for paraphrase endpoint - now supports multiple articles"""
     articles: list[dict] = Field(..., description="List of articles to synthesize and paraphrase")
-    
-    class Config:
-        json_schema_extra = {
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "articles": [
                     {
@@ -53,15 +56,17 @@ class ParaphraseRequest(BaseModel):
                 ]
             }
         }
+    )
 
 
 class ParaphraseResponse(BaseModel):
     """Response model for paraphrase endpoint with synthesized content"""
     synthesized_article: str = Field(..., description="Single synthesized article (1200-1500 characters)")
     headline: str = Field(..., description="Article headline (max 70 characters)")
+    paragraphs: list[str] = Field(default=[], description="Article paragraphs, pre-split for exporters")
     source_count: int = Field(..., description="Number of articles synthesized")
     word_counts: dict = Field(..., description="Character and word counts")
-    source_articles: list[dict] = Field(default=[], description="Source articles information for references")
+    source_articles: list[dict] = Field(default=[], description="Source article reference metadata (title/link/date)")
 
 
 class ErrorResponse(BaseModel):
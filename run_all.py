@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Run the LLM test scripts concurrently instead of one after another"""
+
+import asyncio
+import sys
+import time
+
+from test_enhanced_paragraphs import run_paragraph_forcing
+from test_fallback import run_fallback_check
+from test_gemini import run_gemini_check
+
+# The tests are I/O-bound on HTTPS calls to Gemini/DeepSeek, so running
+# them together makes the suite take roughly as long as its slowest test
+# instead of the sum. The semaphore keeps the fan-out under provider
+# rate limits. Everything runs on ONE event loop: the fallback and
+# paragraph tests drive main.py's module-level httpx.AsyncClient, which
+# is not safe to use from multiple loops. Only the Gemini check, which
+# uses the synchronous SDK and touches no shared async state, goes to a
+# worker thread.
+MAX_CONCURRENCY = 5
+
+
+async def run_test(name, awaitable, semaphore):
+    """Run one test under the shared concurrency cap"""
+    async with semaphore:
+        passed = await awaitable
+    return name, passed
+
+
+async def main():
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    tests = [
+        ("gemini_api", asyncio.to_thread(run_gemini_check)),
+        ("fallback_system", run_fallback_check()),
+        ("paragraph_forcing", run_paragraph_forcing()),
+    ]
+
+    start = time.time()
+    results = await asyncio.gather(
+        *(run_test(name, awaitable, semaphore) for name, awaitable in tests)
+    )
+    elapsed = time.time() - start
+
+    print("\n" + "=" * 50)
+    print(f"📋 Test suite finished in {elapsed:.1f}s")
+    for name, passed in results:
+        print(f"   {'✅' if passed else '❌'} {name}")
+
+    return all(passed for _, passed in results)
+
+
+if __name__ == "__main__":
+    success = asyncio.run(main())
+    sys.exit(0 if success else 1)
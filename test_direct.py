@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 """Direct test of the synthesis function"""
 
+import asyncio
+import logging
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -8,8 +10,8 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from main import synthesize_articles
 from models import ParaphraseRequest
 
-def test_direct_synthesis():
-    """Test synthesis function directly"""
+def run_direct_synthesis():
+    """Exercise the synthesis function directly; returns True on success"""
     
     import signal
     import time
@@ -46,7 +48,7 @@ def test_direct_synthesis():
     
     try:
         print("🔄 Testing direct synthesis...")
-        result = synthesize_articles(test_request.articles)
+        result = asyncio.run(synthesize_articles(test_request.articles))
         
         print("✅ Synthesis completed!")
         print(f"📰 Headline: {result['headline']}")
@@ -72,12 +74,17 @@ def test_direct_synthesis():
             
     except Exception as e:
         print(f"❌ Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logging.getLogger(__name__).exception("Direct synthesis test failed")
         return False
 
+
+def test_direct_synthesis():
+    """Pytest entry point"""
+    assert run_direct_synthesis()
+
+
 if __name__ == "__main__":
-    success = test_direct_synthesis()
+    success = run_direct_synthesis()
     if success:
         print("\n✅ Direct synthesis test PASSED!")
     else:
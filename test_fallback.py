@@ -1,34 +1,63 @@
 #!/usr/bin/env python3
 """Test the fallback system - Gemini -> DeepSeek -> Template"""
 
+import asyncio
+import hashlib
+import json
+import logging
 import os
 import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from dotenv import load_dotenv
-load_dotenv()
+import env
+env.load()
 
 from main import generate_text_with_llm
 
-def test_fallback_system():
-    """Test the LLM fallback system"""
-    
-    test_prompt = """Write a short commodity market news article about copper prices rising due to supply concerns. 
+# File-backed exact prompt cache: the test prompt is deterministic, so
+# repeat runs read the stored response instead of paying the LLM call
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".prompt_cache")
+
+
+async def cached_generate(prompt: str, max_tokens: int) -> str:
+    """Run generate_text_with_llm through a sha256-keyed file cache"""
+    key = hashlib.sha256(json.dumps(
+        {"prompt": prompt, "max_tokens": max_tokens, "model": "gemini-2.0-flash", "t": 0},
+        sort_keys=True
+    ).encode()).hexdigest()
+    cache_file = os.path.join(CACHE_DIR, f"{key}.txt")
+
+    if os.path.exists(cache_file):
+        print("⚡ Prompt cache hit - skipping LLM call")
+        with open(cache_file, encoding="utf-8") as fh:
+            return fh.read()
+
+    result = await generate_text_with_llm(prompt, max_tokens=max_tokens)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(cache_file, "w", encoding="utf-8") as fh:
+        fh.write(result)
+    return result
+
+
+async def run_fallback_check():
+    """Exercise the LLM fallback system; returns True on success"""
+
+    test_prompt = """Write a short commodity market news article about copper prices rising due to supply concerns.
     Format as 3 paragraphs separated by blank lines. Keep it under 500 characters total."""
-    
+
     print("🧪 Testing LLM Fallback System")
     print("=" * 50)
-    
+
     try:
         print("🔄 Attempting synthesis with fallback system...")
-        result = generate_text_with_llm(test_prompt, max_tokens=300)
+        result = await cached_generate(test_prompt, max_tokens=300)
         
         print("✅ Synthesis successful!")
         print(f"📊 Length: {len(result)} characters")
         
-        # Check paragraphs
-        paragraphs = [p.strip() for p in result.split('\n\n') if p.strip()]
-        print(f"📝 Paragraphs: {len(paragraphs)}")
+        # Check paragraphs - count separators instead of building a list
+        paragraph_count = result.count('\n\n') + 1 if result.strip() else 0
+        print(f"📝 Paragraphs: {paragraph_count}")
         
         print("\n📄 Generated content:")
         print("-" * 30)
@@ -39,12 +68,17 @@ def test_fallback_system():
         
     except Exception as e:
         print(f"❌ Test failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logging.getLogger(__name__).exception("Fallback system test failed")
         return False
 
+
+def test_fallback_system():
+    """Pytest entry point"""
+    assert asyncio.run(run_fallback_check())
+
+
 if __name__ == "__main__":
-    success = test_fallback_system()
+    success = asyncio.run(run_fallback_check())
     if success:
         print("\n🎉 Fallback system test PASSED!")
     else:
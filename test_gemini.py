@@ -2,53 +2,55 @@
 """Test script to verify Google Gemini API functionality"""
 
 import os
-from dotenv import load_dotenv
+import env
 
-# Load environment variables
-load_dotenv()
+# Load environment variables (memoized across test modules)
+env.load()
 
-def test_gemini_api():
-    """Test basic Gemini API functionality"""
+def run_gemini_check(model=None):
+    """
+    Exercise basic Gemini API functionality; returns True on success.
+
+    An already-configured model (e.g. the pytest session fixture) can be
+    passed in so the check reuses it instead of building its own.
+    """
     try:
-        import google.generativeai as genai
-        
+        from llm_client import batch_generate
+
         # Get API key
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             print("❌ GEMINI_API_KEY not found in environment")
             return False
-            
+
         print(f"✅ API Key found: {api_key[:10]}...{api_key[-5:]}")
-        
-        # Configure Gemini
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.0-flash')
-        
-        # Test with simple prompt
+
+        # Test with simple prompt - batch_generate amortizes the request
+        # when more prompts are added, and answers index by position
         test_prompt = "Write a short paragraph about copper mining in 100 words."
         print(f"🔄 Testing with prompt: {test_prompt}")
-        
-        response = model.generate_content(
-            test_prompt,
-            generation_config=genai.types.GenerationConfig(
-                max_output_tokens=150,
-                temperature=0.7
-            )
-        )
-        
+
+        results = batch_generate([test_prompt], max_tokens=150, model=model)
+
         print("✅ Gemini API response received:")
-        print(response.text.strip())
-        print(f"📊 Response length: {len(response.text.strip())} characters")
-        
+        print(results[0])
+        print(f"📊 Response length: {len(results[0])} characters")
+
         return True
         
     except Exception as e:
         print(f"❌ Gemini API error: {str(e)}")
         return False
 
+
+def test_gemini_api(gemini_model):
+    """Pytest entry point - the session fixture supplies the configured model"""
+    assert run_gemini_check(gemini_model)
+
+
 if __name__ == "__main__":
     print("🧪 Testing Google Gemini API...")
-    success = test_gemini_api()
+    success = run_gemini_check()
     if success:
         print("\n✅ Gemini API test completed successfully!")
     else: